@@ -5,6 +5,7 @@ from .core import (
     perform_split,
     process_pdf_automatic,
     process_pdf_manual,
+    split_many,
 )
 from .cli import main
 
@@ -19,5 +20,6 @@ __all__ = [
     "perform_split",
     "process_pdf_automatic",
     "process_pdf_manual",
+    "split_many",
     "main",
 ]
@@ -1,4 +1,6 @@
 import argparse
+import logging
+import sys
 from pathlib import Path
 
 import fitz
@@ -7,6 +9,18 @@ from .utils import VERSION, CONFIG_FILE_NAME
 from .core import process_pdf_manual, process_pdf_automatic, merge_chapters, perform_split
 
 
+class _ConsoleFormatter(logging.Formatter):
+    """Formats library log records as plain console lines, labelling problems by level."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.ERROR:
+            return f"Error: {message}"
+        if record.levelno >= logging.WARNING:
+            return f"Warning: {message}"
+        return message
+
+
 def main() -> None:
     """Entry point for the command-line application."""
     parser = argparse.ArgumentParser(description="Split a PDF document into chapters.")
@@ -35,6 +49,14 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # The library reports progress through logging; show it as plain console output.
+    # Only pdfpy's own loggers are configured, so third-party records stay off stdout.
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(_ConsoleFormatter("%(message)s"))
+    library_logger = logging.getLogger("pdfpy")
+    library_logger.setLevel(logging.INFO)
+    library_logger.addHandler(console)
+
     if not args.pdf_file:
         parser.print_help()
         return
@@ -1,42 +1,92 @@
+import functools
+import logging
+import multiprocessing
+import os
 import re
-from io import BytesIO
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Pattern, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
 
 import fitz  # PyMuPDF
 
 from .utils import (
-    TITLE_CLEANUP_REGEX,
+    TITLE_CLEANUP_TABLE,
     MAX_TITLE_LENGTH,
     Chapter,
     Config,
-    is_chapter_title,
+    _compile_regex,
+    _is_bold_span,
+    _literal_prefix,
 )
 
+logger = logging.getLogger(__name__)
+
+_WS_RE = re.compile(r"\s+")
+_LEADING_JUNK_RE = re.compile(r"^[^\w]+")
+_MANUAL_PAGES_RE = re.compile(r"\s*(?:[+-]?\d+\s*)?(?:,\s*(?:[+-]?\d+\s*)?)*")
+_PAGE_NUMBER_RE = re.compile(r"[+-]?\d+")
+# Numbered backreferences (\1) and conditionals ((?(1)...)); may over-match escaped text.
+_NUMBERED_GROUP_REF_RE = re.compile(r"\\[1-9]|\(\?\(\d")
+# Inline global flags such as (?x); scoped groups like (?i:...) are fine.
+_GLOBAL_INLINE_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+# Pages sampled from the start of a document to decide whether it has a text layer.
+_TEXT_PROBE_PAGES = 5
+
+# Process pools only pay off once worker start-up is amortized over enough work. A
+# spawned worker needs ~0.25 s just to import PyMuPDF, while a dense text page scans
+# for styled titles in ~2 ms, so short documents are faster in-process.
+_MAX_POOL_WORKERS = 4
+_PARALLEL_STYLE_MIN_PAGES = 500
+_split_worker_doc: Optional[fitz.Document] = None
+# Set inside split_many workers so per-document work does not start nested pools.
+_in_batch_worker = False
+
+# Default "dict" extraction flags minus image blocks, which style detection never reads.
+_STYLE_TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+
+def _pool_size(limit: int) -> int:
+    """Returns how many worker processes to use for at most ``limit`` parallel tasks.
+
+    Daemonic processes (e.g. ``multiprocessing.Pool`` workers) may not start children,
+    so work running inside one always stays serial.
+    """
+    if _in_batch_worker or multiprocessing.current_process().daemon:
+        return 1
+    return max(1, min(os.cpu_count() or 1, limit))
+
 
 def _normalize_chapters(chapters: List[Chapter], page_count: int) -> List[Chapter]:
     """Sorts chapters and removes duplicates / out-of-range pages."""
     if page_count <= 0:
         return []
 
-    normalized: List[Chapter] = []
-    seen_pages = set()
+    # Keyed by page; dicts keep insertion order, so the first title per page wins.
+    normalized: Dict[int, Chapter] = {}
+
+    # Bookmark and manual inputs usually arrive in page order already.
+    needs_sort = any(chapters[i].page > chapters[i + 1].page for i in range(len(chapters) - 1))
+    ordered = sorted(chapters, key=lambda item: item.page) if needs_sort else chapters
 
-    for chapter in sorted(chapters, key=lambda item: item.page):
-        if chapter.page in seen_pages:
+    for chapter in ordered:
+        if chapter.page in normalized:
             continue
 
         if not (1 <= chapter.page <= page_count):
-            print(
-                f"Warning: Ignoring '{chapter.title}' because page {chapter.page} "
-                f"is outside valid range 1-{page_count}."
+            logger.warning(
+                "Ignoring '%s' because page %d is outside valid range 1-%d.",
+                chapter.title,
+                chapter.page,
+                page_count,
             )
             continue
 
-        normalized.append(chapter)
-        seen_pages.add(chapter.page)
+        normalized[chapter.page] = chapter
 
-    return normalized
+    return list(normalized.values())
 
 
 def _parse_manual_pages(pages_str: Optional[str]) -> Optional[List[int]]:
@@ -47,23 +97,19 @@ def _parse_manual_pages(pages_str: Optional[str]) -> Optional[List[int]]:
     if not pages_str.strip():
         return []
 
-    tokens = [token.strip() for token in pages_str.split(",") if token.strip()]
-    if not tokens:
-        return []
-
-    pages: List[int] = []
-    for token in tokens:
-        try:
-            page = int(token)
-        except ValueError:
-            return None
+    # Whole input must be comma-separated (optionally signed) integers or empty entries,
+    # so "2,three,5" and "1 2" are rejected rather than partially parsed.
+    if _MANUAL_PAGES_RE.fullmatch(pages_str) is None:
+        return None
 
-        if page <= 0:
-            return None
+    pages = set(map(int, _PAGE_NUMBER_RE.findall(pages_str)))
+    if any(page <= 0 for page in pages):
+        return None
 
-        pages.append(page)
+    if not pages:
+        return []
 
-    unique_pages = sorted(set(pages))
+    unique_pages = sorted(pages)
     if len(unique_pages) == 1 and unique_pages[0] > 1:
         unique_pages.insert(0, 1)
 
@@ -71,19 +117,29 @@ def _parse_manual_pages(pages_str: Optional[str]) -> Optional[List[int]]:
 
 
 def _compile_chapter_pattern(config: Config) -> Optional[Pattern[str]]:
-    """Compiles chapter regex once and handles malformed patterns safely."""
+    """Returns the config's compiled chapter regex, reporting malformed patterns.
+
+    Yields the same cached object as ``config.pattern``, but compiles directly so the
+    ``re.error`` reason reaches the log.
+    """
     regex_pattern = config.chapter_regex
     try:
-        pattern = re.compile(regex_pattern, re.IGNORECASE)
-        print(f"\nUsing pattern to find chapters: '{regex_pattern}'")
-        return pattern
+        pattern = _compile_regex(regex_pattern)
     except re.error as error:
-        print(f"Error: Invalid CHAPTER_REGEX in config file. Reason: {error}")
+        logger.error("Invalid CHAPTER_REGEX in config file. Reason: %s", error)
         return None
 
+    logger.info("Using pattern to find chapters: '%s'", regex_pattern)
+    return pattern
 
-def _compile_ocr_patterns(config: Config) -> List[Pattern[str]]:
-    """Compiles OCR regex patterns from config and skips invalid entries."""
+
+def _compile_ocr_patterns(config: Config) -> Tuple[List[Pattern[str]], Optional[Pattern[str]]]:
+    """Compiles OCR regex patterns from config and skips invalid entries.
+
+    Returns the individual patterns (for logging) plus a single alternation of
+    all valid patterns, so each OCR line is matched with one regex scan. The
+    alternation is None when it would not match like the patterns do separately.
+    """
     compiled: List[Pattern[str]] = []
     seen = set()
 
@@ -95,28 +151,50 @@ def _compile_ocr_patterns(config: Config) -> List[Pattern[str]]:
 
         seen.add(candidate)
         try:
-            compiled.append(re.compile(candidate, re.IGNORECASE))
+            compiled.append(_compile_regex(candidate))
         except re.error as error:
-            print(f"Warning: Ignoring invalid OCR regex '{candidate}'. Reason: {error}")
+            logger.warning("Ignoring invalid OCR regex '%s'. Reason: %s", candidate, error)
 
     if compiled:
         preview = ", ".join(pattern.pattern for pattern in compiled)
-        print(f"\nUsing OCR patterns: {preview}")
+        logger.info("Using OCR patterns: %s", preview)
     else:
-        print("Warning: No valid OCR regex patterns available.")
+        logger.warning("No valid OCR regex patterns available.")
+        return compiled, None
+
+    # Joining patterns renumbers their groups, which silently breaks numbered references.
+    # Inline global flags stop being leading once wrapped; Python < 3.11 only warns and
+    # applies them to every alternative, while 3.11+ raises.
+    if any(
+        (pattern.groups and _NUMBERED_GROUP_REF_RE.search(pattern.pattern))
+        or _GLOBAL_INLINE_FLAGS_RE.search(pattern.pattern)
+        for pattern in compiled
+    ):
+        return compiled, None
+
+    try:
+        combined = _compile_regex("|".join(f"(?:{pattern.pattern})" for pattern in compiled))
+    except re.error:
+        # Patterns that are valid alone may still not combine (e.g. duplicate group names).
+        combined = None
 
-    return compiled
+    return compiled, combined
 
 
 def _normalize_ocr_line(line: str) -> str:
     """Normalizes OCR output line for matching."""
-    candidate = re.sub(r"\s+", " ", line).strip()
-    candidate = re.sub(r"^[^\w]+", "", candidate)
+    candidate = _WS_RE.sub(" ", line).strip()
+    candidate = _LEADING_JUNK_RE.sub("", candidate)
     return candidate
 
 
+@functools.lru_cache(maxsize=1)
 def _load_ocr_dependencies() -> Tuple[Optional[object], Optional[object]]:
-    """Loads optional OCR dependencies at runtime."""
+    """Loads optional OCR dependencies at runtime.
+
+    The result is cached, so Tesseract discovery (which spawns ``tesseract --version``)
+    runs once per process rather than once per document.
+    """
     try:
         import pytesseract
         from PIL import Image
@@ -146,52 +224,211 @@ def _load_ocr_dependencies() -> Tuple[Optional[object], Optional[object]]:
     return None, None
 
 
-def find_chapters_by_style(doc: fitz.Document, config: Config) -> List[Chapter]:
-    """Finds chapter start pages by analyzing text style and content."""
+def _render_ocr_page(page: fitz.Page, config: Config) -> Tuple[int, int, int, bytes]:
+    """Renders a page straight to 8-bit grayscale samples for OCR.
+
+    Returns (width, height, stride, samples); avoids a PNG encode/decode round-trip.
+    MuPDF's gray conversion differs from Pillow's ``convert("L")`` on colored content
+    (a few dozen gray levels at most), so OCR input is close to, not identical to, an
+    RGB render converted afterwards.
+    """
+    pixmap = page.get_pixmap(dpi=config.ocr_render_dpi, colorspace=fitz.csGRAY, alpha=False)
+    return pixmap.width, pixmap.height, pixmap.stride, pixmap.samples
+
+
+def _ocr_page_image(
+    item: Tuple[int, Tuple[int, int, int, bytes], str]
+) -> Tuple[int, Optional[str], Optional[str]]:
+    """Runs Tesseract on one rendered page. Executed inside OCR worker processes."""
+    page_num, (width, height, stride, samples), tesseract_cmd = item
+    try:
+        import pytesseract
+        from PIL import Image
+
+        # Worker processes do not inherit a tesseract path discovered at runtime.
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        image = Image.frombuffer("L", (width, height), samples, "raw", "L", stride, 1)
+        # Grayscale + PSM 6 improves OCR on scanned pages.
+        text = pytesseract.image_to_string(image, config="--psm 6")
+        return page_num, text, None
+    except Exception as error:
+        return page_num, None, str(error)
+
+
+def _iter_ocr_page_texts(
+    doc: fitz.Document, config: Config, tesseract_cmd: str, parallel: bool = False
+) -> Iterator[Tuple[int, Optional[str], Optional[str]]]:
+    """Yields (page_num, text, error) in page order.
+
+    With ``parallel``, Tesseract runs in a process pool. Pages are still rendered in
+    the calling process (a Document cannot be shared across processes) while workers
+    OCR earlier pages. At most two pages per worker are in flight, so only a few
+    rendered pages are held in memory.
+    """
+    workers = _pool_size(min(_MAX_POOL_WORKERS, doc.page_count)) if parallel else 1
+
+    if workers <= 1:
+        for page_num, page in enumerate(doc):
+            try:
+                rendered = _render_ocr_page(page, config)
+            except Exception as error:
+                yield page_num, None, str(error)
+                continue
+            yield _ocr_page_image((page_num, rendered, tesseract_cmd))
+        return
+
+    window = workers * 2
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for page_num, page in enumerate(doc):
+            try:
+                rendered = _render_ocr_page(page, config)
+            except Exception as error:
+                future: Future = Future()
+                future.set_result((page_num, None, str(error)))
+            else:
+                future = executor.submit(_ocr_page_image, (page_num, rendered, tesseract_cmd))
+            pending.append(future)
+
+            if len(pending) >= window:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def _first_chapter_title(
+    blocks: List[dict],
+    pattern: Pattern[str],
+    prefix: str,
+    min_size: float,
+    must_be_bold: bool,
+) -> Optional[str]:
+    """Returns the text of the first chapter-title span in a page's blocks, if any.
+
+    Inlines ``is_chapter_title`` (same checks, same order) with the config values
+    hoisted by the caller, since this runs once per span.
+    """
+    match = pattern.match
+    prefix_len = len(prefix)
+    for block in blocks:
+        if "lines" not in block:
+            continue
+        for line in block["lines"]:
+            for span in line["spans"]:
+                if span["size"] < min_size:
+                    continue
+                if must_be_bold and not _is_bold_span(span):
+                    continue
+                text = span["text"].strip()
+                if prefix and not text[:prefix_len].casefold().startswith(prefix):
+                    continue
+                if match(text) is not None:
+                    return text
+    return None
+
+
+def _can_reopen(doc: fitz.Document) -> bool:
+    """Checks whether worker processes can reopen ``doc`` from disk unchanged."""
+    return (
+        isinstance(doc, fitz.Document)
+        and bool(doc.name)
+        and not doc.is_dirty
+        and not doc.needs_pass
+    )
+
+
+def _scan_pages_for_chapters(
+    pages: Iterable[Tuple[int, fitz.Page]], pattern: Pattern[str], config: Config
+) -> List[Chapter]:
+    """Scans (page_num, page) pairs for styled chapter titles, one per page."""
     found_chapters = []
+
+    prefix = _literal_prefix(pattern.pattern)
+    min_size, must_be_bold = config.min_font_size, config.must_be_bold
+
+    for page_num, page in pages:
+        # One TextPage serves both the plain-text prefilter and the styled extraction.
+        textpage = page.get_textpage(flags=_STYLE_TEXT_FLAGS)
+
+        # A title span must start with the literal prefix, so a page whose text does not
+        # contain it anywhere can be skipped. The span need not start its text line
+        # (e.g. "12 Chapter 1" with a page number on the same baseline).
+        if prefix and prefix not in textpage.extractText().casefold():
+            continue
+
+        blocks = textpage.extractDICT()["blocks"]
+        title = _first_chapter_title(blocks, pattern, prefix, min_size, must_be_bold)
+        if title is not None:
+            found_chapters.append(Chapter(title=title, page=page_num + 1))
+    return found_chapters
+
+
+def _scan_page_range(job: Tuple[str, int, int, Config]) -> List[Chapter]:
+    """Scans pages [start, stop) of a PDF file. Executed inside style worker processes."""
+    pdf_path, start, stop, config = job
+    pattern = config.pattern
+    with fitz.open(pdf_path) as doc:
+        pages = ((page_num, doc[page_num]) for page_num in range(start, stop))
+        return _scan_pages_for_chapters(pages, pattern, config)
+
+
+def find_chapters_by_style(
+    doc: fitz.Document, config: Config, parallel: bool = False
+) -> List[Chapter]:
+    """Finds chapter start pages by analyzing text style and content.
+
+    Pages are scanned in-process unless ``parallel`` is set, in which case long,
+    file-backed documents are scanned in contiguous page ranges across worker processes.
+    """
     pattern = _compile_chapter_pattern(config)
     if pattern is None:
         return []
 
-    for page_num, page in enumerate(doc):
-        blocks = page.get_text("dict")["blocks"]
-        for block in blocks:
-            if "lines" not in block:
-                continue
-            for line in block["lines"]:
-                for span in line["spans"]:
-                    text = span["text"].strip()
-                    if is_chapter_title(text, span, pattern, config):
-                        if not any(c.page == page_num + 1 for c in found_chapters):
-                            found_chapters.append(Chapter(title=text, page=page_num + 1))
+    workers = _pool_size(_MAX_POOL_WORKERS) if parallel else 1
+    if workers <= 1 or not _can_reopen(doc) or doc.page_count < _PARALLEL_STYLE_MIN_PAGES:
+        return _scan_pages_for_chapters(enumerate(doc), pattern, config)
+
+    page_count = doc.page_count
+    step = -(-page_count // workers)
+    jobs = [
+        (doc.name, start, min(start + step, page_count), config)
+        for start in range(0, page_count, step)
+    ]
+
+    found_chapters = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chapters in executor.map(_scan_page_range, jobs):
+            found_chapters.extend(chapters)
     return found_chapters
 
 
-def find_chapters_by_ocr(doc: fitz.Document, config: Config) -> List[Chapter]:
-    """Finds chapter pages using OCR for scanned/image-based PDFs."""
+def find_chapters_by_ocr(
+    doc: fitz.Document, config: Config, parallel: bool = False
+) -> List[Chapter]:
+    """Finds chapter pages using OCR for scanned/image-based PDFs.
+
+    Pages are OCR'd one at a time unless ``parallel`` opts in to Tesseract worker processes.
+    """
     found_chapters = []
-    patterns = _compile_ocr_patterns(config)
+    patterns, combined = _compile_ocr_patterns(config)
 
     pytesseract, image_module = _load_ocr_dependencies()
     if pytesseract is None or image_module is None:
-        print("OCR dependencies are unavailable. Install pytesseract, Pillow, and Tesseract OCR.")
+        logger.warning(
+            "OCR dependencies are unavailable. Install pytesseract, Pillow, and Tesseract OCR."
+        )
         return []
 
     fallback_title = ""
+    tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
 
-    for page_num, page in enumerate(doc):
-        try:
-            pixmap = page.get_pixmap(dpi=config.ocr_render_dpi, alpha=False)
-            png_bytes = pixmap.tobytes("png")
-            with image_module.open(BytesIO(png_bytes)) as image:
-                # Grayscale + PSM 6 improves OCR on scanned pages.
-                text = pytesseract.image_to_string(image.convert("L"), config="--psm 6")
-        except Exception as error:
-            print(f"Warning: OCR failed on page {page_num + 1}. Reason: {error}")
+    for page_num, text, error in _iter_ocr_page_texts(doc, config, tesseract_cmd, parallel):
+        if text is None:
+            logger.warning("OCR failed on page %d. Reason: %s", page_num + 1, error)
             continue
 
-        page_already_captured = any(chapter.page == page_num + 1 for chapter in found_chapters)
-
+        # Each page is visited once, so stop at its first matching line.
         for line in text.splitlines():
             normalized = _normalize_ocr_line(line)
             if not normalized:
@@ -200,18 +437,20 @@ def find_chapters_by_ocr(doc: fitz.Document, config: Config) -> List[Chapter]:
             if not fallback_title:
                 fallback_title = normalized[:MAX_TITLE_LENGTH]
 
-            if page_already_captured:
-                continue
+            if combined is not None:
+                matched = combined.match(normalized) is not None
+            else:
+                matched = any(pattern.match(normalized) for pattern in patterns)
 
-            if any(pattern.match(normalized) for pattern in patterns):
+            if matched:
                 found_chapters.append(Chapter(title=normalized, page=page_num + 1))
-                page_already_captured = True
+                break
 
     if found_chapters:
         return found_chapters
 
     if config.ocr_fallback_to_first_page and doc.page_count > 0:
-        print("OCR patterns did not match. Falling back to first-page split.")
+        logger.info("OCR patterns did not match. Falling back to first-page split.")
         title = fallback_title if fallback_title else "Scanned_Section_1"
         return [Chapter(title=title, page=1)]
 
@@ -220,94 +459,210 @@ def find_chapters_by_ocr(doc: fitz.Document, config: Config) -> List[Chapter]:
 
 def merge_chapters(doc: fitz.Document, chapters: List[Chapter], out_path: Path):
     """Merges selected chapters into a single PDF file."""
-    chapters = _normalize_chapters(chapters, doc.page_count)
-    print(f"\nMerging {len(chapters)} sections into one file...")
+    page_count = doc.page_count
+    chapters = _normalize_chapters(chapters, page_count)
+    logger.info("Merging %d sections into one file...", len(chapters))
 
     if not chapters:
-        print("Warning: No valid chapters available to merge.")
+        logger.warning("No valid chapters available to merge.")
         return
 
+    # Normalized chapters are sorted and unique, and each one runs up to the next, so
+    # together they cover exactly the first chapter's page through the last page.
+    start_page = chapters[0].page - 1
+    end_page = page_count - 1
+
     with fitz.open() as writer:
-        for i, chapter in enumerate(chapters):
-            start_page = chapter.page - 1
-            end_page = doc.page_count - 1
-            if i + 1 < len(chapters):
-                end_page = chapters[i + 1].page - 2
+        writer.insert_pdf(doc, from_page=start_page, to_page=end_page)
+        writer.save(out_path)
+    logger.info("Created merged document: '%s'", out_path)
+
 
-            if start_page <= end_page and 0 <= start_page < doc.page_count:
-                writer.insert_pdf(doc, from_page=start_page, to_page=end_page)
+def _write_page_range(doc: fitz.Document, start_page: int, end_page: int, out_path: Path):
+    """Writes a 0-based, inclusive page range of ``doc`` to a new PDF file.
 
+    ``insert_pdf`` into an empty writer is far cheaper than reopening the source and
+    ``select``-ing the range, which re-serializes the whole source per output file.
+    Reusing one writer and deleting its pages between saves is no better: deleted
+    pages leave orphaned objects that each save must either write out or collect.
+    """
+    with fitz.open() as writer:
+        writer.insert_pdf(doc, from_page=start_page, to_page=end_page)
         writer.save(out_path)
-    print(f"  - Created merged document: '{out_path}'")
 
 
-def perform_split(doc: fitz.Document, chapters: List[Chapter], out_dir: Path):
-    """Core logic to split a PDF based on a list of chapters."""
-    chapters = _normalize_chapters(chapters, doc.page_count)
+def _init_split_worker(pdf_path: str):
+    """Opens the source document once per split worker process."""
+    global _split_worker_doc
+    _split_worker_doc = fitz.open(pdf_path)
+
+
+def _write_page_range_in_worker(job: Tuple[int, int, Path]):
+    """Writes one chapter from the worker's own copy of the source document."""
+    start_page, end_page, out_path = job
+    _write_page_range(_split_worker_doc, start_page, end_page, out_path)
+
+
+def _write_page_ranges(
+    doc: fitz.Document, jobs: List[Tuple[int, int, Path]], parallel: bool = False
+) -> Iterator[Tuple[int, int, Path]]:
+    """Writes each (start, end, out_path) job and yields it once written, in order.
+
+    With ``parallel``, an unmodified, file-backed document is split by worker
+    processes, each reopening the source. PyMuPDF does not support threads, so a
+    thread pool is not an option.
+    """
+    workers = _pool_size(min(_MAX_POOL_WORKERS, len(jobs))) if parallel else 1
+
+    if workers <= 1 or not _can_reopen(doc):
+        for start_page, end_page, out_path in jobs:
+            _write_page_range(doc, start_page, end_page, out_path)
+            yield start_page, end_page, out_path
+        return
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_split_worker, initargs=(doc.name,)
+    ) as executor:
+        results = executor.map(_write_page_range_in_worker, jobs, chunksize=chunksize)
+        for job, _ in zip(jobs, results):
+            yield job
+
+
+def perform_split(
+    doc: fitz.Document, chapters: List[Chapter], out_dir: Path, parallel: bool = False
+):
+    """Core logic to split a PDF based on a list of chapters.
+
+    Chapters are written serially unless ``parallel`` is set. Worker start-up (each
+    imports PyMuPDF and reopens the source) usually costs more than a whole serial
+    split, so only opt in for very large documents. Parallel workers reopen ``doc``
+    from disk, so ``doc`` (and its file) must not be modified while the split is running.
+    """
+    page_count = doc.page_count
+    chapters = _normalize_chapters(chapters, page_count)
     if not chapters:
-        print("\nWarning: No chapters were provided or found to split.")
+        logger.warning("No chapters were provided or found to split.")
         return
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"\nFound {len(chapters)} sections. Splitting document...")
-    output_index = 0
+    logger.info("Found %d sections. Splitting document...", len(chapters))
+    jobs: List[Tuple[int, int, Path]] = []
 
     for i, chapter in enumerate(chapters):
         start_page = chapter.page - 1
-        end_page = doc.page_count - 1
+        end_page = page_count - 1
         if i + 1 < len(chapters):
             end_page = chapters[i + 1].page - 2
 
         if start_page > end_page:
-            print(f"Warning: Skipping '{chapter.title}' due to invalid page range.")
+            logger.warning("Skipping '%s' due to invalid page range.", chapter.title)
             continue
 
-        output_index += 1
+        output_index = len(jobs) + 1
 
         # Sanitize title
-        clean_title = re.sub(TITLE_CLEANUP_REGEX, "", chapter.title).strip()
+        clean_title = chapter.title.translate(TITLE_CLEANUP_TABLE).strip()
         clean_title = clean_title.replace(" ", "_")[:MAX_TITLE_LENGTH]
         if not clean_title:
             clean_title = f"Section_{output_index}"
 
         out_path = out_dir / f"{output_index:02d}_{clean_title}.pdf"
+        jobs.append((start_page, end_page, out_path))
+
+    for start_page, end_page, out_path in _write_page_ranges(doc, jobs, parallel):
+        logger.info("Created '%s' (Pages %d-%d)", out_path, start_page + 1, end_page + 1)
+
+
+def _page_has_text(page: fitz.Page) -> bool:
+    """Checks whether a page has any non-whitespace extractable text."""
+    # flags=0 skips ligature/whitespace processing; only emptiness matters here.
+    return bool(page.get_text("text", flags=0).strip())
+
+
+def _has_text_layer(doc: fitz.Document) -> bool:
+    """Checks for extractable text on the first pages, then on ~10 evenly spaced pages."""
+    if any(_page_has_text(page) for page in islice(doc, _TEXT_PROBE_PAGES)):
+        return True
+
+    if not isinstance(doc, fitz.Document):
+        return False
 
-        with fitz.open() as writer:
-            writer.insert_pdf(doc, from_page=start_page, to_page=end_page)
-            writer.save(out_path)
-        print(f"  - Created '{out_path}' (Pages {start_page + 1}-{end_page + 1})")
+    # Scanned front matter (covers, plates) can precede the text layer.
+    step = max(1, doc.page_count // 10)
+    return any(
+        _page_has_text(doc[page_num])
+        for page_num in range(0, doc.page_count, step)
+        if page_num >= _TEXT_PROBE_PAGES
+    )
 
 
-def process_pdf_automatic(doc: fitz.Document, config_path: Path, allow_ocr: bool = False) -> List[Chapter]:
-    """Orchestrates automatic PDF splitting with optional OCR fallback."""
+def _top_level_bookmarks(doc: fitz.Document) -> List[Chapter]:
+    """Returns Level 1 bookmarks without walking nested outline entries."""
+    if not isinstance(doc, fitz.Document):
+        return [Chapter(title=item[1], page=item[2]) for item in doc.get_toc() if item[0] == 1]
+
+    # Same checks as Document.get_toc(): refuse closed documents and refresh the outline,
+    # which set_toc_item()/del_toc_item() edits would otherwise leave stale.
+    if doc.is_closed:
+        raise ValueError("document closed")
+    doc.init_doc()
+
+    chapters = []
+    item = doc.outline
+    # Same loop guard and title/page resolution as Document.get_toc(), minus the
+    # recursion; an empty outline is a wrapper around a null item.
+    while item and item.this.m_internal:
+        page = -1
+        if not item.is_external and item.uri:
+            if item.page == -1:
+                page = doc.resolve_link(item.uri)[0] + 1
+            else:
+                page = item.page + 1
+
+        chapters.append(Chapter(title=item.title or " ", page=page))
+        item = item.next
+
+    return chapters
+
+
+def process_pdf_automatic(
+    doc: fitz.Document, config_path: Path, allow_ocr: bool = False, parallel: bool = False
+) -> List[Chapter]:
+    """Orchestrates automatic PDF splitting with optional OCR fallback.
+
+    ``parallel`` opts in to worker processes for OCR and for the style scan of long
+    documents.
+    """
     chapters = []
     config = Config.from_file(config_path)
 
-    toc = doc.get_toc()
-    if toc:
-        print("\nFound bookmarks. Splitting by all top-level (Level 1) entries.")
-        chapters = [Chapter(title=item[1], page=item[2]) for item in toc if item[0] == 1]
+    chapters = _top_level_bookmarks(doc)
+    if chapters:
+        logger.info("Found bookmarks. Splitting by all top-level (Level 1) entries.")
 
     if not chapters:
-        print("\nNo top-level bookmarks found. Analyzing text styles as a fallback.")
-        is_text_based = any(page.get_text("text") for page in doc)
+        logger.info("No top-level bookmarks found. Analyzing text styles as a fallback.")
+        is_text_based = _has_text_layer(doc)
         if not is_text_based:
-            print("\nThis PDF appears to be image-based (scanned).")
+            logger.info("This PDF appears to be image-based (scanned).")
             if allow_ocr:
-                print("Attempting OCR fallback...")
-                chapters = find_chapters_by_ocr(doc, config)
+                logger.info("Attempting OCR fallback...")
+                chapters = find_chapters_by_ocr(doc, config, parallel=parallel)
                 if chapters:
-                    print(f"Found {len(chapters)} sections via OCR.")
+                    logger.info("Found %d sections via OCR.", len(chapters))
                     return chapters
-                print("OCR fallback could not detect chapters.")
+                logger.info("OCR fallback could not detect chapters.")
             else:
-                print("OCR fallback is disabled.")
+                logger.info("OCR fallback is disabled.")
 
-            print("Automatic mode cannot process it reliably. Please use --ocr or Manual Mode.")
+            logger.warning(
+                "Automatic mode cannot process it reliably. Please use --ocr or Manual Mode."
+            )
             return []
 
-        chapters = find_chapters_by_style(doc, config)
+        chapters = find_chapters_by_style(doc, config, parallel=parallel)
 
     return chapters
 
@@ -316,7 +671,71 @@ def process_pdf_manual(pages_str: Optional[str]) -> Optional[List[Chapter]]:
     """Processes a user-provided string of page numbers."""
     pages = _parse_manual_pages(pages_str)
     if pages is None:
-        print("Error: Invalid page numbers provided. Please use comma-separated positive integers.")
+        logger.error(
+            "Invalid page numbers provided. Please use comma-separated positive integers."
+        )
         return None
 
     return [Chapter(title=f"Section_Page_{page}", page=page) for page in pages]
+
+
+def _init_batch_worker():
+    """Marks a split_many worker process so nested process pools are not started."""
+    global _in_batch_worker
+    _in_batch_worker = True
+
+
+def _split_one(job: Tuple[Path, Path, Path, bool]) -> Tuple[Path, List[Chapter]]:
+    """Opens one PDF once, detects its chapters and splits it."""
+    pdf_path, config_path, out_dir, allow_ocr = job
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception as error:
+        logger.error("Could not read '%s'. Reason: %s", pdf_path, error)
+        return pdf_path, []
+
+    with doc:
+        try:
+            chapters = process_pdf_automatic(doc, config_path, allow_ocr=allow_ocr)
+            if chapters:
+                perform_split(doc, chapters, out_dir)
+            else:
+                logger.warning("No valid chapters found in '%s'.", pdf_path)
+        except Exception as error:
+            # One failing file must not abort (and discard the results of) the whole batch.
+            logger.error("Could not split '%s'. Reason: %s", pdf_path, error)
+            return pdf_path, []
+    return pdf_path, chapters
+
+
+def split_many(
+    pdf_paths: List[Path], config_path: Path, out_root: Path, allow_ocr: bool = False
+) -> Dict[Path, List[Chapter]]:
+    """Splits several PDFs in automatic mode, each into ``out_root / <pdf stem>``.
+
+    Every document is opened once and shared between chapter detection and splitting.
+    Multiple files are processed in parallel worker processes (one file per worker).
+    Returns the chapters found for each input path; files that cannot be read or split
+    are logged and map to ``[]``.
+
+    Raises ValueError if two inputs share a stem (compared case-insensitively), since
+    they would be split into the same output folder.
+    """
+    stems: Dict[str, Path] = {}
+    for pdf_path in pdf_paths:
+        other = stems.get(pdf_path.stem.casefold())
+        if other is not None:
+            raise ValueError(
+                f"'{other}' and '{pdf_path}' would both be split into "
+                f"'{out_root / pdf_path.stem}'."
+            )
+        stems[pdf_path.stem.casefold()] = pdf_path
+
+    jobs = [(pdf_path, config_path, out_root / pdf_path.stem, allow_ocr) for pdf_path in pdf_paths]
+    workers = _pool_size(len(jobs))
+
+    if workers <= 1:
+        return dict(_split_one(job) for job in jobs)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as executor:
+        return dict(executor.map(_split_one, jobs))
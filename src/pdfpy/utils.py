@@ -1,12 +1,19 @@
+import functools
+import logging
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Optional, Pattern
+
+logger = logging.getLogger(__name__)
 
 VERSION = "2.0.0"
 CONFIG_FILE_NAME = "chapters_config.md"
 MAX_TITLE_LENGTH = 100
 TITLE_CLEANUP_REGEX = r'[\\/*?:"><|]'
+# Same character set as TITLE_CLEANUP_REGEX, for str.translate.
+TITLE_CLEANUP_TABLE = str.maketrans("", "", '\\/*?:"><|')
 DEFAULT_OCR_REGEXES = [
     r"^Chapter\s+\d+",
     r"^Section\s+[\d.IVXLCDM]+",
@@ -16,9 +23,14 @@ DEFAULT_OCR_REGEXES = [
 ]
 
 
-@dataclass
+# slots=True needs Python 3.10+. A hand-written __slots__ would break unpickling of frozen
+# instances (which the worker pools need); the dataclass-generated slots do not.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Chapter:
-    """Represents a single chapter with a title and starting page."""
+    """Represents a single chapter with a title and starting page (immutable)."""
     title: str
     page: int
 
@@ -33,51 +45,203 @@ class Config:
     ocr_fallback_to_first_page: bool = True
     ocr_render_dpi: int = 300
 
+    @property
+    def pattern(self) -> Optional[Pattern[str]]:
+        """Case-insensitive compiled ``chapter_regex``, or None if it is invalid."""
+        try:
+            return _compile_regex(self.chapter_regex)
+        except re.error:
+            return None
+
     @staticmethod
     def from_file(config_path: Path) -> "Config":
-        """Parses the chapter style configuration file."""
-        config = Config()
+        """Parses the chapter style configuration file.
+
+        Parsed results are cached per (path, mtime, size); editing the file invalidates
+        the cache. Each call returns a fresh copy that callers may modify freely.
+        """
         if not config_path.is_file():
-            print(f"Info: Configuration file not found at '{config_path}'. Using defaults.")
-            return config
+            logger.info("Configuration file not found at '%s'. Using defaults.", config_path)
+            return Config()
 
         try:
-            with config_path.open("r", encoding="utf-8") as file_handle:
-                for line in file_handle:
-                    if ":" in line and not line.strip().startswith("<!--"):
-                        key, value = map(str.strip, line.split(":", 1))
-                        if key == "CHAPTER_REGEX":
-                            config.chapter_regex = value
-                        elif key == "MIN_FONT_SIZE":
-                            try:
-                                config.min_font_size = float(value)
-                            except ValueError:
-                                pass
-                        elif key == "MUST_BE_BOLD":
-                            config.must_be_bold = value.lower() == "true"
-                        elif key == "OCR_REGEXES":
-                            regexes = [item.strip() for item in value.split("||") if item.strip()]
-                            if regexes:
-                                config.ocr_regexes = regexes
-                        elif key == "OCR_FALLBACK_TO_FIRST_PAGE":
-                            config.ocr_fallback_to_first_page = value.lower() == "true"
-                        elif key == "OCR_RENDER_DPI":
-                            try:
-                                dpi = int(value)
-                                if dpi > 0:
-                                    config.ocr_render_dpi = dpi
-                            except ValueError:
-                                pass
-        except Exception as error:
-            print(f"Warning: Could not parse configuration file. Error: {error}")
-
-        return config
-
-
-def is_chapter_title(text: str, span: dict, pattern: re.Pattern, config: Config) -> bool:
-    """Checks if a text span matches the chapter title criteria."""
-    is_large_enough = span["size"] >= config.min_font_size
-    is_bold = "bold" in span["font"].lower()
-    bold_ok = not config.must_be_bold or is_bold
-    matches_pattern = pattern.match(text)
-    return is_large_enough and bold_ok and bool(matches_pattern)
+            stat = config_path.stat()
+        except OSError:
+            return _parse_config_file(config_path)
+
+        cached = _load_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
+        return replace(cached, ocr_regexes=list(cached.ocr_regexes))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_regex(regex: str) -> Pattern[str]:
+    """Compiles a chapter/OCR regex case-insensitively, once per distinct source."""
+    return re.compile(regex, re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> Config:
+    """Parses a configuration file once per (path, mtime, size) key."""
+    return _parse_config_file(Path(path_str))
+
+
+def _set_chapter_regex(config: Config, value: str):
+    """Applies CHAPTER_REGEX."""
+    config.chapter_regex = value
+
+
+def _set_min_font_size(config: Config, value: str):
+    """Applies MIN_FONT_SIZE; non-numeric values are ignored."""
+    try:
+        config.min_font_size = float(value)
+    except ValueError:
+        pass
+
+
+def _set_must_be_bold(config: Config, value: str):
+    """Applies MUST_BE_BOLD."""
+    config.must_be_bold = value.lower() == "true"
+
+
+def _set_ocr_regexes(config: Config, value: str):
+    """Applies OCR_REGEXES, a "||"-separated list."""
+    regexes = [item.strip() for item in value.split("||") if item.strip()]
+    if regexes:
+        config.ocr_regexes = regexes
+
+
+def _set_ocr_fallback_to_first_page(config: Config, value: str):
+    """Applies OCR_FALLBACK_TO_FIRST_PAGE."""
+    config.ocr_fallback_to_first_page = value.lower() == "true"
+
+
+def _set_ocr_render_dpi(config: Config, value: str):
+    """Applies OCR_RENDER_DPI; non-positive or non-integer values are ignored."""
+    try:
+        dpi = int(value)
+        if dpi > 0:
+            config.ocr_render_dpi = dpi
+    except ValueError:
+        pass
+
+
+# Config file key -> handler applying its (already stripped) value.
+_CONFIG_HANDLERS: Dict[str, Callable[[Config, str], None]] = {
+    "CHAPTER_REGEX": _set_chapter_regex,
+    "MIN_FONT_SIZE": _set_min_font_size,
+    "MUST_BE_BOLD": _set_must_be_bold,
+    "OCR_REGEXES": _set_ocr_regexes,
+    "OCR_FALLBACK_TO_FIRST_PAGE": _set_ocr_fallback_to_first_page,
+    "OCR_RENDER_DPI": _set_ocr_render_dpi,
+}
+
+# One "KEY: value" setting per line for the keys above; other lines simply do not match.
+_CONFIG_LINE_RE = re.compile(
+    r"^[ \t]*(" + "|".join(map(re.escape, _CONFIG_HANDLERS)) + r")[ \t]*:[ \t]*(.*?)[ \t]*$",
+    re.MULTILINE,
+)
+
+
+def _parse_config_file(config_path: Path) -> Config:
+    """Reads configuration values from a Markdown config file."""
+    config = Config()
+    try:
+        text = config_path.read_text(encoding="utf-8")
+        for match in _CONFIG_LINE_RE.finditer(text):
+            _CONFIG_HANDLERS[match.group(1)](config, match.group(2))
+    except Exception as error:
+        logger.warning("Could not parse configuration file. Reason: %s", error)
+
+    return config
+
+
+# PyMuPDF span flag bit for bold text (fitz.TEXT_FONT_BOLD).
+_SPAN_FLAG_BOLD = 16
+
+# Font name -> "is bold" lookups; a document only uses a handful of distinct fonts.
+_BOLD_CACHE_MAX_SIZE = 256
+_BOLD_CACHE: Dict[str, bool] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _literal_prefix(regex: str) -> str:
+    """Returns the casefolded literal text that every match of ``regex`` starts with.
+
+    Only plain ASCII letters/digits are collected; an empty string means no
+    usable prefix (e.g. top-level alternation or a leading group/class). Collection
+    stops at "i": ``re.IGNORECASE`` also matches it against "ı" and "İ", which
+    casefolding does not.
+    """
+    depth = 0
+    escaped = in_class = False
+    for char in regex:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return ""
+
+    body = regex[1:] if regex.startswith("^") else regex
+    length = 0
+    while (
+        length < len(body)
+        and body[length].isascii()
+        and body[length].isalnum()
+        and body[length] not in "iI"
+    ):
+        length += 1
+
+    # A following ?, * or {m,n} quantifier makes the last literal optional.
+    if body[length:length + 1] in ("?", "*", "{"):
+        length -= 1
+
+    return body[:max(length, 0)].casefold()
+
+
+def _is_bold_span(span: dict) -> bool:
+    """Checks the span's bold flag bit first, then falls back to its font name."""
+    if span.get("flags", 0) & _SPAN_FLAG_BOLD:
+        return True
+
+    font = span["font"]
+    is_bold = _BOLD_CACHE.get(font)
+    if is_bold is None:
+        is_bold = "bold" in font.lower()
+        if len(_BOLD_CACHE) < _BOLD_CACHE_MAX_SIZE:
+            _BOLD_CACHE[font] = is_bold
+    return is_bold
+
+
+def is_chapter_title(
+    text: str, span: dict, pattern: Optional[Pattern[str]], config: Config
+) -> bool:
+    """Checks if a text span matches the chapter title criteria.
+
+    ``pattern`` may be None to use the compiled ``config.pattern``.
+    """
+    if pattern is None:
+        pattern = config.pattern
+        if pattern is None:
+            return False
+
+    # Cheapest checks first; most body-text spans fail on size alone.
+    if span["size"] < config.min_font_size:
+        return False
+
+    if config.must_be_bold and not _is_bold_span(span):
+        return False
+
+    prefix = _literal_prefix(pattern.pattern)
+    if prefix and not text[:len(prefix)].casefold().startswith(prefix):
+        return False
+
+    return pattern.match(text) is not None
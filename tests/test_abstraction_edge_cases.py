@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import fitz
+import pytest
 
 from pdfpy import (
     Chapter,
@@ -109,7 +110,59 @@ def test_find_chapters_by_style_keeps_first_match_per_page(tmp_path):
     assert chapters[0].page == 1
 
 
-def test_find_chapters_by_style_returns_empty_for_invalid_regex(tmp_path):
+def test_find_chapters_by_style_detects_heading_below_body_text(tmp_path):
+    pdf_path = tmp_path / "heading_below_body.pdf"
+    doc = fitz.open()
+
+    page = doc.new_page()
+    page.insert_text((50, 50), "Running header", fontsize=10, fontname="helv")
+    page.insert_text((50, 120), "Chapter 3: Results", fontsize=20, fontname="helv")
+
+    page = doc.new_page()
+    page.insert_text((50, 50), "Body text mentioning Chapter 3", fontsize=20, fontname="helv")
+
+    doc.save(pdf_path)
+    doc.close()
+
+    doc = fitz.open(pdf_path)
+    config = Config(min_font_size=18, must_be_bold=False)
+    chapters = find_chapters_by_style(doc, config)
+    doc.close()
+
+    assert [(chapter.title, chapter.page) for chapter in chapters] == [
+        ("Chapter 3: Results", 1),
+    ]
+
+
+def test_find_chapters_by_style_detects_heading_sharing_line_with_page_number(tmp_path):
+    pdf_path = tmp_path / "heading_after_page_number.pdf"
+    doc = fitz.open()
+
+    page = doc.new_page()
+    # One TextWriter run keeps both spans on the same extracted text line: "12 Chapter 1: Intro".
+    writer = fitz.TextWriter(page.rect)
+    writer.append((50, 50), "12 ", fontsize=10)
+    writer.append(writer.last_point, "Chapter 1: Intro", fontsize=20)
+    writer.write_text(page)
+
+    page = doc.new_page()
+    page.insert_text((50, 50), "Chapter 2: Methods", fontsize=20, fontname="helv")
+
+    doc.save(pdf_path)
+    doc.close()
+
+    doc = fitz.open(pdf_path)
+    config = Config(min_font_size=18, must_be_bold=False)
+    chapters = find_chapters_by_style(doc, config)
+    doc.close()
+
+    assert [(chapter.title, chapter.page) for chapter in chapters] == [
+        ("Chapter 1: Intro", 1),
+        ("Chapter 2: Methods", 2),
+    ]
+
+
+def test_find_chapters_by_style_returns_empty_for_invalid_regex(tmp_path, caplog):
     pdf_path = tmp_path / "invalid_regex.pdf"
     doc = fitz.open()
     page = doc.new_page()
@@ -123,6 +176,8 @@ def test_find_chapters_by_style_returns_empty_for_invalid_regex(tmp_path):
     doc.close()
 
     assert chapters == []
+    # The re.error reason (message and position) is logged, not just the failure.
+    assert "at position 0" in caplog.text
 
 
 def test_process_pdf_automatic_prefers_level_one_bookmarks(tmp_path):
@@ -145,6 +200,31 @@ def test_process_pdf_automatic_prefers_level_one_bookmarks(tmp_path):
     ]
 
 
+def test_process_pdf_automatic_reads_bookmarks_after_toc_item_edits(tmp_path):
+    doc = fitz.open()
+    for _ in range(5):
+        doc.new_page()
+    doc.set_toc([[1, "Intro", 1], [2, "Nested", 2], [1, "Later", 4]])
+    doc.set_toc_item(0, title="Preface")
+    doc.del_toc_item(2)
+
+    chapters = process_pdf_automatic(doc, tmp_path / "missing_config.md")
+    expected = [(item[1], item[2]) for item in doc.get_toc() if item[0] == 1]
+    doc.close()
+
+    assert [(chapter.title, chapter.page) for chapter in chapters] == expected
+    assert expected == [("Preface", 1), ("Later", -1)]
+
+
+def test_process_pdf_automatic_rejects_closed_document(tmp_path):
+    doc = fitz.open()
+    doc.new_page()
+    doc.close()
+
+    with pytest.raises(ValueError):
+        process_pdf_automatic(doc, tmp_path / "missing_config.md")
+
+
 def test_process_pdf_automatic_falls_back_when_toc_has_no_level_one(tmp_path):
     config_path = tmp_path / "chapters_config.md"
     config_path.write_text(
@@ -167,6 +247,23 @@ def test_process_pdf_automatic_falls_back_when_toc_has_no_level_one(tmp_path):
     ]
 
 
+def test_process_pdf_automatic_picks_up_config_edits_between_runs(tmp_path):
+    config_path = tmp_path / "chapters_config.md"
+    config_path.write_text("MIN_FONT_SIZE: 18\nMUST_BE_BOLD: false\n", encoding="utf-8")
+
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "Chapter 1: Introduction", fontsize=20, fontname="helv")
+
+    first = process_pdf_automatic(doc, config_path)
+    config_path.write_text("MIN_FONT_SIZE: 30.0\nMUST_BE_BOLD: false\n", encoding="utf-8")
+    second = process_pdf_automatic(doc, config_path)
+    doc.close()
+
+    assert [chapter.page for chapter in first] == [1]
+    assert second == []
+
+
 def test_process_pdf_automatic_returns_empty_for_non_text_pdf(tmp_path):
     doc = fitz.open()
     doc.new_page()
@@ -178,6 +275,24 @@ def test_process_pdf_automatic_returns_empty_for_non_text_pdf(tmp_path):
     assert chapters == []
 
 
+def test_process_pdf_automatic_detects_text_after_blank_front_matter(tmp_path):
+    config_path = tmp_path / "chapters_config.md"
+    config_path.write_text("MIN_FONT_SIZE: 18\nMUST_BE_BOLD: false\n", encoding="utf-8")
+
+    doc = fitz.open()
+    for _ in range(8):
+        doc.new_page()
+    page = doc.new_page()
+    page.insert_text((50, 50), "Chapter 1: After Plates", fontsize=20, fontname="helv")
+
+    chapters = process_pdf_automatic(doc, config_path)
+    doc.close()
+
+    assert [(chapter.title, chapter.page) for chapter in chapters] == [
+        ("Chapter 1: After Plates", 9),
+    ]
+
+
 def test_perform_split_ignores_invalid_pages_and_duplicates(tmp_path):
     pdf_path = tmp_path / "numbered.pdf"
     _create_numbered_pdf(pdf_path, page_count=6)
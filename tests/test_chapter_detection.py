@@ -1,3 +1,4 @@
+import dataclasses
 import pytest
 import fitz
 import re
@@ -41,6 +42,25 @@ def test_is_chapter_title():
     span_wrong_text = {"size": 20, "font": "Helvetica-Bold", "text": "Introduction"}
     assert is_chapter_title("Introduction", span_wrong_text, pattern, config) is False
 
+    span_bold_flag = {"size": 20, "font": "Helvetica", "flags": 16, "text": "Chapter 1"}
+    assert is_chapter_title("Chapter 1", span_bold_flag, pattern, config) is True
+
+def test_is_chapter_title_literal_prefix_edge_cases():
+    config = Config(min_font_size=16, must_be_bold=False)
+    span = {"size": 20, "font": "Helvetica", "text": ""}
+
+    alternation = re.compile(r"^Chapter\s+\d+|^Part\s+[IVX]+", re.IGNORECASE)
+    assert is_chapter_title("Part IV", span, alternation, config) is True
+    assert is_chapter_title("CHAPTER 2", span, alternation, config) is True
+
+    optional_suffix = re.compile(r"^Chapters?\s+\d+")
+    assert is_chapter_title("Chapter 3", span, optional_suffix, config) is True
+    assert is_chapter_title("Chapte 3", span, optional_suffix, config) is False
+
+    # re.IGNORECASE treats "i" and the dotless "ı" as equal; casefolding does not.
+    dotless = re.compile(r"^Section\s+\d+", re.IGNORECASE)
+    assert is_chapter_title("Sect\u0131on 1", span, dotless, config) is True
+
 def test_find_chapters_by_style(styled_pdf):
     doc = fitz.open(styled_pdf)
     config = Config(min_font_size=18, must_be_bold=False)
@@ -52,3 +72,10 @@ def test_find_chapters_by_style(styled_pdf):
     assert chapters[0].page == 1
     assert chapters[1].title == "Chapter 2: Methods"
     assert chapters[1].page == 3
+
+
+def test_chapter_is_immutable_and_hashable():
+    chapter = Chapter(title="Chapter 1", page=1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        chapter.page = 2
+    assert {chapter, Chapter(title="Chapter 1", page=1)} == {chapter}
@@ -53,3 +53,28 @@ def test_config_invalid_file(tmp_path):
     assert config.must_be_bold is True
     assert config.ocr_fallback_to_first_page is True
     assert config.ocr_render_dpi == 300
+
+
+def test_config_from_file_reflects_edits_and_returns_copies(tmp_path):
+    config_file = tmp_path / "cached_config.md"
+    config_file.write_text("MIN_FONT_SIZE: 12\n")
+
+    first = Config.from_file(config_file)
+    first.min_font_size = 99.0
+    first.ocr_regexes.append(r"^Mutated")
+
+    second = Config.from_file(config_file)
+    assert second.min_font_size == 12.0
+    assert r"^Mutated" not in second.ocr_regexes
+
+    config_file.write_text("MIN_FONT_SIZE: 14.5\n")
+    assert Config.from_file(config_file).min_font_size == 14.5
+
+
+def test_config_exposes_compiled_pattern():
+    config = Config()
+    assert config.pattern.match("CHAPTER 7")
+    assert config.pattern is Config().pattern
+
+    config.chapter_regex = r"("
+    assert config.pattern is None
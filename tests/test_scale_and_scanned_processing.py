@@ -7,6 +7,7 @@ import pytest
 from pdfpy import (
     Chapter,
     Config,
+    core,
     find_chapters_by_style,
     merge_chapters,
     perform_split,
@@ -74,6 +75,29 @@ def _is_ocr_runtime_available() -> bool:
     return False
 
 
+def _fake_ocr_page_image(item):
+    """Stands in for Tesseract: every fourth page, starting at page 2, reads "AA-Part N"."""
+    page_num = item[0]
+    text = f"AA-Part {page_num // 4 + 1}\nbody" if page_num % 4 == 1 else "body text"
+    return page_num, text, None
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    class _FakeTesseract:
+        pytesseract = type("pytesseract", (), {"tesseract_cmd": "tesseract"})
+
+    monkeypatch.setattr(core, "_load_ocr_dependencies", lambda: (_FakeTesseract, object()))
+    monkeypatch.setattr(core, "_ocr_page_image", _fake_ocr_page_image)
+
+
+def _blank_doc(page_count: int) -> fitz.Document:
+    doc = fitz.open()
+    for _ in range(page_count):
+        doc.new_page(width=100, height=100)
+    return doc
+
+
 @pytest.mark.skipif(not _is_ocr_runtime_available(), reason="OCR runtime not available")
 def test_process_pdf_automatic_detects_chapter_in_scanned_pdf_with_ocr(tmp_path):
     import pytesseract
@@ -139,6 +163,47 @@ def test_process_pdf_automatic_scanned_pdf_fallbacks_to_first_page_split_when_no
     assert chapters[0].page == 1
 
 
+def test_find_chapters_by_ocr_keeps_numbered_backreferences_working(fake_ocr):
+    doc = _blank_doc(6)
+    config = Config(ocr_regexes=[r"^(Appendix|Annex)\s+\d+", r"^(\w)\1-Part"], ocr_render_dpi=10)
+    chapters = core.find_chapters_by_ocr(doc, config)
+    doc.close()
+
+    assert [(chapter.title, chapter.page) for chapter in chapters] == [
+        ("AA-Part 1", 2),
+        ("AA-Part 2", 6),
+    ]
+
+
+def test_find_chapters_by_ocr_keeps_inline_flags_local_to_their_pattern(fake_ocr):
+    doc = _blank_doc(3)
+    # Verbose mode must not leak into "^AA-Part 1", whose space is significant.
+    config = Config(ocr_regexes=[r"^AA-Part 1", r"(?x) ^ Appendix \s+ [A-Z]"], ocr_render_dpi=10)
+    patterns, combined = core._compile_ocr_patterns(config)
+    chapters = core.find_chapters_by_ocr(doc, config)
+    doc.close()
+
+    assert len(patterns) == 3
+    assert combined is None
+    assert [(chapter.title, chapter.page) for chapter in chapters] == [("AA-Part 1", 2)]
+
+
+def test_find_chapters_by_ocr_pool_matches_serial_and_caps_workers(fake_ocr, monkeypatch):
+    doc = _blank_doc(23)
+    config = Config(ocr_regexes=[r"^(\w)\1-Part"], ocr_render_dpi=10)
+
+    limits = []
+    monkeypatch.setattr(core, "_pool_size", lambda limit: limits.append(limit) or 3)
+    serial = core.find_chapters_by_ocr(doc, config)
+    assert limits == []
+    parallel = core.find_chapters_by_ocr(doc, config, parallel=True)
+    doc.close()
+
+    assert [chapter.page for chapter in serial] == [2, 6, 10, 14, 18, 22]
+    assert parallel == serial
+    assert limits == [core._MAX_POOL_WORKERS]
+
+
 def test_process_pdf_automatic_accepts_ocr_flag_when_disabled(tmp_path):
     doc = fitz.open()
     doc.new_page()
@@ -163,6 +228,40 @@ def test_find_chapters_by_style_large_document(tmp_path):
     assert chapters[-1].page == 153
 
 
+def test_find_chapters_by_style_parallel_scan_matches_serial(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "large_styled_parallel.pdf"
+    _create_large_styled_pdf(pdf_path, page_count=160, chapter_every=8)
+    config = Config(min_font_size=18, must_be_bold=False)
+
+    doc = fitz.open(pdf_path)
+    serial = find_chapters_by_style(doc, config)
+    monkeypatch.setattr(core, "_pool_size", lambda limit: 3)
+    monkeypatch.setattr(core, "_PARALLEL_STYLE_MIN_PAGES", 1)
+    parallel = find_chapters_by_style(doc, config, parallel=True)
+    doc.close()
+
+    assert len(serial) == 20
+    assert parallel == serial
+
+
+def test_find_chapters_by_style_stays_in_process_by_default(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "large_styled_default.pdf"
+    _create_large_styled_pdf(pdf_path, page_count=40, chapter_every=8)
+
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started without parallel=True")
+
+    monkeypatch.setattr(core, "_pool_size", lambda limit: 3)
+    monkeypatch.setattr(core, "_PARALLEL_STYLE_MIN_PAGES", 1)
+    monkeypatch.setattr(core, "ProcessPoolExecutor", _no_pool)
+
+    doc = fitz.open(pdf_path)
+    chapters = find_chapters_by_style(doc, Config(min_font_size=18, must_be_bold=False))
+    doc.close()
+
+    assert [chapter.page for chapter in chapters] == [1, 9, 17, 25, 33]
+
+
 def test_perform_split_large_number_of_sections(tmp_path):
     pdf_path = tmp_path / "split_large.pdf"
     _create_text_pdf(pdf_path, page_count=120)
@@ -1,7 +1,8 @@
 import pytest
 import fitz
 from pathlib import Path
-from pdfpy import Chapter, perform_split, merge_chapters
+from pdfpy import Chapter, perform_split, merge_chapters, split_many
+from pdfpy import core
 
 @pytest.fixture
 def dummy_pdf(tmp_path):
@@ -53,3 +54,117 @@ def test_merge_chapters(dummy_pdf, tmp_path):
     # Total: 9 pages
     assert d_merged.page_count == 9
     d_merged.close()
+
+def test_merge_chapters_keeps_pages_in_order(dummy_pdf, tmp_path):
+    doc = fitz.open(dummy_pdf)
+    chapters = [
+        Chapter(title="Chapter 2", page=7),
+        Chapter(title="Chapter 1", page=3),
+    ]
+    out_path = tmp_path / "merged_order.pdf"
+    merge_chapters(doc, chapters, out_path)
+    doc.close()
+
+    d_merged = fitz.open(out_path)
+    texts = [page.get_text("text").strip() for page in d_merged]
+    d_merged.close()
+    assert texts == [f"Page {i}" for i in range(3, 11)]
+
+
+def test_split_many_splits_each_pdf_into_its_own_folder(tmp_path):
+    pdf_paths = []
+    for name, toc in [("first", [[1, "Intro", 1], [1, "Body", 3]]), ("second", [[1, "Only", 1]])]:
+        doc = fitz.open()
+        for i in range(4):
+            doc.new_page().insert_text((50, 50), f"{name} page {i + 1}")
+        doc.set_toc(toc)
+        pdf_path = tmp_path / f"{name}.pdf"
+        doc.save(pdf_path)
+        doc.close()
+        pdf_paths.append(pdf_path)
+
+    out_root = tmp_path / "batch"
+    results = split_many(pdf_paths, tmp_path / "missing_config.md", out_root)
+
+    assert [chapter.title for chapter in results[pdf_paths[0]]] == ["Intro", "Body"]
+    assert [chapter.title for chapter in results[pdf_paths[1]]] == ["Only"]
+    assert sorted(path.name for path in (out_root / "first").glob("*.pdf")) == [
+        "01_Intro.pdf",
+        "02_Body.pdf",
+    ]
+    assert sorted(path.name for path in (out_root / "second").glob("*.pdf")) == ["01_Only.pdf"]
+
+
+def test_perform_split_parallel_matches_serial_output(dummy_pdf, tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "_pool_size", lambda limit: 2)
+    chapters = [Chapter(title=f"Part {page}", page=page) for page in (1, 3, 4, 8)]
+
+    doc = fitz.open(dummy_pdf)
+    perform_split(doc, chapters, tmp_path / "serial")
+    perform_split(doc, chapters, tmp_path / "parallel", parallel=True)
+    doc.close()
+
+    def _page_texts(out_dir):
+        texts = {}
+        for path in sorted(out_dir.glob("*.pdf")):
+            with fitz.open(path) as part:
+                texts[path.name] = [page.get_text("text").strip() for page in part]
+        return texts
+
+    assert _page_texts(tmp_path / "parallel") == _page_texts(tmp_path / "serial")
+    assert list(_page_texts(tmp_path / "parallel")) == [
+        "01_Part_1.pdf",
+        "02_Part_3.pdf",
+        "03_Part_4.pdf",
+        "04_Part_8.pdf",
+    ]
+
+
+def test_pool_size_is_serial_inside_daemonic_processes(monkeypatch):
+    class _DaemonProcess:
+        daemon = True
+
+    monkeypatch.setattr(core.multiprocessing, "current_process", lambda: _DaemonProcess())
+    assert core._pool_size(8) == 1
+
+
+def test_split_many_rejects_inputs_sharing_a_stem(tmp_path):
+    pdf_paths = []
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        doc = fitz.open()
+        doc.new_page()
+        doc.save(tmp_path / folder / "book.pdf")
+        doc.close()
+        pdf_paths.append(tmp_path / folder / "book.pdf")
+
+    with pytest.raises(ValueError):
+        split_many(pdf_paths, tmp_path / "missing_config.md", tmp_path / "batch")
+
+    assert not (tmp_path / "batch").exists()
+
+
+def test_split_many_keeps_going_after_a_file_fails(tmp_path):
+    pdf_paths = []
+    for name in ("blocked", "fine"):
+        doc = fitz.open()
+        doc.new_page().insert_text((50, 50), f"{name} page")
+        doc.set_toc([[1, "Only", 1]])
+        doc.save(tmp_path / f"{name}.pdf")
+        doc.close()
+        pdf_paths.append(tmp_path / f"{name}.pdf")
+
+    out_root = tmp_path / "batch"
+    out_root.mkdir()
+    # A file where the output folder should be makes that one split fail.
+    (out_root / "blocked").write_text("not a folder", encoding="utf-8")
+    (tmp_path / "broken.pdf").write_bytes(b"not a pdf")
+
+    results = split_many(
+        pdf_paths + [tmp_path / "broken.pdf"], tmp_path / "missing_config.md", out_root
+    )
+
+    assert results[pdf_paths[0]] == []
+    assert [chapter.title for chapter in results[pdf_paths[1]]] == ["Only"]
+    assert results[tmp_path / "broken.pdf"] == []
+    assert (out_root / "fine" / "01_Only.pdf").exists()